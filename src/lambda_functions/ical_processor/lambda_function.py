@@ -1,19 +1,201 @@
 import boto3
-import recurring_ical_events
 import os
-import base64
+import binascii
+import functools
 import zipfile
 import io
 import json
-import pytz
-from datetime import datetime, timedelta
-from icalendar import Calendar
+import logging
+import re
+import tempfile
+import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+# icalendar and recurring_ical_events are slow to import, so they are
+# imported where first used - cold starts that fail validation never load them
 
-def get_upcoming_events(ical_content, days_ahead=7):
+# Upper bound on concurrent S3 GETs when downloading calendar files
+MAX_DOWNLOAD_WORKERS = 16
+
+# Upper bound on concurrent S3 PUTs when uploading calendar files from the zip
+MAX_UPLOAD_WORKERS = 16
+
+# Concurrent CreateSchedule/DeleteSchedule calls
+MAX_SCHEDULER_WORKERS = 20
+
+# Concurrent delete_objects calls (1000 keys each) when emptying the bucket
+MAX_DELETE_WORKERS = 8
+
+# The S3 client is shared by the upload/download/delete worker pools, so size its
+# connection pool to match. Parallel bulk deletes can also trip S3 SlowDown
+# throttling - let botocore back off and retry.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=max(MAX_DOWNLOAD_WORKERS, MAX_UPLOAD_WORKERS),
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Size the Scheduler client's connection pool to its worker pool (botocore's
+# default of 10 would queue half the workers), and back off on throttling
+SCHEDULER_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_SCHEDULER_WORKERS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Calendar files larger than this are streamed into a buffer sized from the
+# response's ContentLength and decoded to text, instead of a single read()
+STREAMING_DOWNLOAD_THRESHOLD = 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Zip payloads that decode to more than this are written to a temporary file on
+# /tmp in chunks rather than held in memory. The chunk size is a multiple of 4 so
+# every chunk is a whole number of base64 quanta.
+ZIP_SPOOL_THRESHOLD = 4 * 1024 * 1024
+ZIP_DECODE_CHUNK_SIZE = 64 * 1024
+BASE64_WHITESPACE_RE = re.compile(r"\s+")
+
+# DTSTART date or date-time value; TZID parameters and the UTC "Z" are ignored
+DTSTART_RE = re.compile(r"DTSTART(?:;[^:]*)?:(\d{8})(?:T(\d{6}))?", re.IGNORECASE)
+
+# VEVENT properties that create or move occurrences - such blocks always need
+# full recurrence expansion, whatever their own DTSTART
+RECURRENCE_PROPERTIES = ("RRULE", "RDATE", "RECURRENCE-ID")
+
+# Slack either side of the search window when prefiltering on DTSTART wall-clock
+# time, which ignores timezones (UTC offsets range from -12h to +14h)
+PREFILTER_MARGIN = timedelta(days=1)
+
+# Backoff (seconds) while schedule group deletion propagates - about 30s in total
+SCHEDULE_GROUP_BACKOFF = (0.5, 1, 2, 4, 8, 8, 8)
+
+# Above this many schedules, deleting and recreating the whole group is cheaper
+# than deleting schedules one by one, despite the propagation wait
+SCHEDULE_GROUP_RECREATE_THRESHOLD = 2000
+
+# Lambda attaches its own handler to the root logger; per-event traces are DEBUG
+# so they only reach CloudWatch when LOG_LEVEL=DEBUG is set
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# boto3 clients are created on first use and reused for the lifetime of the
+# container - client construction (credential chain, endpoint resolution) is
+# too slow to repeat per call or per event. Both clients are thread-safe.
+_S3 = None
+_SCHEDULER = None
+
+
+def _s3():
+    """
+    Shared S3 client
+    """
+    global _S3
+    _S3 = _S3 or boto3.client("s3", config=S3_CLIENT_CONFIG)
+    return _S3
+
+
+def _scheduler():
+    """
+    Shared EventBridge Scheduler client
+    """
+    global _SCHEDULER
+    _SCHEDULER = _SCHEDULER or boto3.client("scheduler", config=SCHEDULER_CLIENT_CONFIG)
+    return _SCHEDULER
+
+
+@functools.lru_cache(maxsize=64)
+def _tz(name):
+    """
+    Cached timezone lookup for interpreting naive times
+
+    zoneinfo rather than pytz: a ZoneInfo is attached with replace(tzinfo=...)
+    and resolves DST from the wall time, with no localize() step.
+    """
+    return ZoneInfo(name)
+
+
+def decode_ical_text(ical_content):
+    """
+    Decode iCal bytes to text, stripping any BOM and replacing invalid UTF-8
+    """
+    try:
+        return ical_content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return ical_content.decode('utf-8-sig', errors='replace')
+
+
+def keep_event_block(block_lines, earliest, latest):
+    """
+    Decide whether a VEVENT block (list of lines) can contain an event in the window
+    """
+    keep = True
+    for line in block_lines:
+        name = line[:13].upper()
+        if name.startswith(RECURRENCE_PROPERTIES):
+            return True
+        if name.startswith("DTSTART"):
+            match = DTSTART_RE.match(line)
+            if not match:
+                return True
+            date_part, time_part = match.group(1), match.group(2) or "000000"
+            try:
+                start = datetime(
+                    int(date_part[:4]), int(date_part[4:6]), int(date_part[6:]),
+                    int(time_part[:2]), int(time_part[2:4]), int(time_part[4:]),
+                )
+            except ValueError:
+                return True
+            keep = earliest <= start <= latest
+    return keep
+
+
+def prefilter_ical_text(ical_text, window_start, window_end):
+    """
+    Drop one-off VEVENT blocks whose DTSTART is clearly outside the search window
+
+    This is a cheap line-based pass over the raw text, so events that can never be
+    returned are not parsed into icalendar objects or handed to the recurrence
+    expansion. DTSTART is compared as a wall-clock time with PREFILTER_MARGIN of
+    slack either side. Events that started before the window are never scheduled
+    anyway. Blocks that recur or override an occurrence, or whose DTSTART can't be
+    read, are always kept, as is everything outside VEVENT blocks (e.g. VTIMEZONE).
+    """
+    earliest = (window_start - PREFILTER_MARGIN).replace(tzinfo=None)
+    latest = (window_end + PREFILTER_MARGIN).replace(tzinfo=None)
+
+    kept_lines = []
+    block = None
+    for line in ical_text.splitlines(keepends=True):
+        if block is None:
+            if line[:12].upper() == "BEGIN:VEVENT":
+                block = [line]
+            else:
+                kept_lines.append(line)
+            continue
+
+        block.append(line)
+        if line[:10].upper() == "END:VEVENT":
+            if keep_event_block(block, earliest, latest):
+                kept_lines.extend(block)
+            block = None
+
+    # An unterminated block is passed through for icalendar to deal with
+    if block:
+        kept_lines.extend(block)
+
+    return "".join(kept_lines)
+
+
+def get_upcoming_events(
+    ical_content, days_ahead=7, notification_minutes=0, fallback_timezone="UTC"
+):
     """
     Extract upcoming events from iCal content.
 
+    Events whose notification time (start minus notification_minutes) has already
+    passed are dropped here, so no schedule work is done for them later.
+
     TIMEZONE HANDLING NOTE:
     =======================
     The recurring_ical_events library returns events with their original datetime
@@ -23,29 +205,39 @@ def get_upcoming_events(ical_content, days_ahead=7):
 
     When calendar apps export .ics files, they often strip timezone information
     to make files "portable". These naive datetimes should be interpreted in the
-    user's local timezone, not UTC. The timezone conversion is handled later in
-    create_event_schedule() function.
+    user's local timezone, not UTC. The same fallback_timezone interpretation is
+    used here to drop past events, and again in create_event_schedule().
     """
-    # Parse the calendar
-    cal = Calendar.from_ical(ical_content)
+    # Imported on first use - see the note at the top of the module
+    import recurring_ical_events
+    from icalendar import Calendar
 
     # Define time window - let recurring_ical_events handle timezone complexity
-    # Note: start_date here is in UTC (Lambda environment timezone)
-    # but this is just for the search window, not event interpretation
-    start_date = datetime.now()
+    # Note: the window bounds are explicitly UTC-aware rather than naive, so the
+    # library compares them against zoned events without guessing at the local
+    # timezone. This is just for the search window, not event interpretation.
+    start_date = datetime.now(tz=timezone.utc)
     end_date = start_date + timedelta(days=days_ahead)
 
-    print(f"=== DEBUG: Event extraction window ===")
-    print(f"Current time: {start_date}")
-    print(f"Search window: {start_date} to {end_date}")
+    # Strip one-off events far outside the window before parsing
+    if isinstance(ical_content, (bytes, bytearray)):
+        ical_content = decode_ical_text(ical_content)
+    ical_content = prefilter_ical_text(ical_content, start_date, end_date)
 
-    # Get events in time window - library handles all complexity!
-    events = recurring_ical_events.of(cal).between(start_date, end_date)
+    # Parse the calendar once and build a single recurrence query from it
+    cal = Calendar.from_ical(ical_content)
+    query = recurring_ical_events.of(cal)
 
-    print(f"Found {len(events)} raw events from calendar")
+    # Get events in time window - library handles all complexity!
+    events = query.between(start_date, end_date)
 
-    # Convert to our format
+    # Convert to our format. Events are compared as POSIX timestamps against one
+    # precomputed cutoff rather than as datetimes converted to UTC one by one.
+    cutoff_ts = start_date.timestamp() + notification_minutes * 60
+    fallback_tz = _tz(fallback_timezone)
     upcoming_events = []
+    all_day_skipped = 0
+    past_skipped = 0
     for event in events:
         start_dt = event["DTSTART"].dt
 
@@ -53,7 +245,17 @@ def get_upcoming_events(ical_content, days_ahead=7):
         # All-day events like birthdays, holidays don't need time-based notifications
         # They use datetime.date objects which don't have timestamp() method
         if not hasattr(start_dt, 'timestamp'):
-            print(f"Skipping all-day event: {event.get('SUMMARY', 'Untitled Event')}")
+            all_day_skipped += 1
+            continue
+
+        # Skip events whose notification time has already passed - naive times
+        # are interpreted in the fallback timezone, as in create_event_schedule()
+        if start_dt.tzinfo:
+            start_ts = start_dt.timestamp()
+        else:
+            start_ts = start_dt.replace(tzinfo=fallback_tz).timestamp()
+        if start_ts <= cutoff_ts:
+            past_skipped += 1
             continue
 
         event_info = {
@@ -65,6 +267,11 @@ def get_upcoming_events(ical_content, days_ahead=7):
         }
         upcoming_events.append(event_info)
 
+    logger.debug(
+        "Found %d events between %s and %s (skipped %d all-day, %d past events)",
+        len(events), start_date, end_date, all_day_skipped, past_skipped,
+    )
+
     return upcoming_events
 
 
@@ -100,7 +307,8 @@ def lambda_handler(event, context):
     """
     Process all iCal files in S3 bucket and create notification schedules
     """
-    # Validate environment variables
+    # Validate configuration up front - a misconfigured function fails before the
+    # payload is decoded or any calendar library is loaded
     bucket_name, schedule_group, env_errors = validate_environment_variables()
     if env_errors:
         return {"error": env_errors[0], "success": False}
@@ -110,25 +318,50 @@ def lambda_handler(event, context):
     if payload_errors:
         return {"error": payload_errors[0], "success": False}
 
+    # Read schedule configuration once for the whole invocation
+    try:
+        schedule_config = get_schedule_configuration()
+    except ValueError as e:
+        return {"error": str(e), "success": False}
+
     try:
-        # Step 1: Clear existing EventBridge schedules
-        print("Clearing existing schedules...")
-        clear_event_bridge_schedules()
-
-        # Step 2: Clear S3 bucket
-        print("Clearing S3 bucket...")
-        files_deleted = clear_bucket(bucket_name)
-
-        # Step 3: Extract and upload calendar files from zip
-        print("Processing zip file...")
-        ical_files = extract_and_upload_calendars(zip_file_b64, bucket_name)
-
-        # Step 4: Process calendar files and create schedules
-        print("Creating schedules...")
-        total_events = process_calendars_and_create_schedules(
-            bucket_name, schedule_group
+        # Step 1: Decode the zip and check it holds calendars before anything
+        # destructive happens - a bad upload must not wipe the existing schedules
+        logger.info("Processing zip file...")
+        zip_buffer = decode_zip_file(zip_file_b64)
+        zip_ref, ical_entries = extract_ical_files_from_zip(zip_buffer)
+
+        with zip_buffer, zip_ref:
+            if not ical_entries:
+                return {"error": "No .ics files found in zip_file", "success": False}
+
+            # Step 2: Clear existing EventBridge schedules
+            logger.info("Clearing existing schedules...")
+            clear_event_bridge_schedules(schedule_group)
+
+            # Step 3: Clear S3 bucket
+            logger.info("Clearing S3 bucket...")
+            files_deleted = clear_bucket(bucket_name)
+
+            # Step 4: Upload calendar files from the already-decoded zip
+            ical_files = extract_and_upload_calendars(zip_ref, ical_entries, bucket_name)
+
+        # Step 5: Process calendar files and create schedules
+        logger.info("Creating schedules...")
+        total_events, schedules_created, schedules_failed = (
+            process_calendars_and_create_schedules(bucket_name, schedule_group, schedule_config)
         )
 
+        if schedules_failed:
+            return {
+                "error": f"Failed to create {schedules_failed} of {total_events} schedules",
+                "calendars_processed": len(ical_files),
+                "total_events": total_events,
+                "schedules_created": schedules_created,
+                "schedules_failed": schedules_failed,
+                "success": False,
+            }
+
         return {
             "message": "Calendar processing completed successfully",
             "bucket_name": bucket_name,
@@ -136,113 +369,271 @@ def lambda_handler(event, context):
             "files_deleted": files_deleted,
             "calendars_processed": len(ical_files),
             "total_events": total_events,
+            "schedules_created": schedules_created,
+            "schedules_failed": schedules_failed,
             "schedules_cleared": True,
             "success": True,
         }
 
     except Exception as e:
-        print(f"Lambda execution failed: {str(e)}")
+        logger.exception("Lambda execution failed: %s", e)
         return {"error": str(e), "success": False}
 
 
-def ensure_schedule_group_exists(scheduler, schedule_group):
+def ensure_schedule_group_exists(scheduler, schedule_group, retry_on_conflict=False):
     """
     Ensure schedule group exists, handling the case where it already exists
+
+    Straight after a group deletion, creating the group can conflict with the
+    pending delete - retry_on_conflict backs off and retries, and raises if the
+    conflict outlasts the backoff.
+    """
+    delays = SCHEDULE_GROUP_BACKOFF if retry_on_conflict else ()
+
+    for attempt in range(len(delays) + 1):
+        try:
+            scheduler.create_schedule_group(Name=schedule_group)
+            logger.info("Created schedule group: %s", schedule_group)
+            return
+        except scheduler.exceptions.ConflictException:
+            if attempt == len(delays):
+                if retry_on_conflict:
+                    # The earlier delete is still pending, so the group is about to vanish
+                    logger.error("Schedule group %s still conflicts after retrying", schedule_group)
+                    raise
+                logger.info("Schedule group %s already exists - continuing", schedule_group)
+                return
+            logger.info(
+                "Schedule group %s conflicts - retrying in %ss", schedule_group, delays[attempt]
+            )
+            time.sleep(delays[attempt])
+        except Exception as e:
+            logger.error("Error creating schedule group: %s", e)
+            raise
+
+
+def wait_for_schedule_group_deletion(scheduler, schedule_group):
+    """
+    Poll until a deleted schedule group is gone, backing off between checks
+    """
+    for delay in SCHEDULE_GROUP_BACKOFF:
+        try:
+            scheduler.get_schedule_group(Name=schedule_group)
+        except (scheduler.exceptions.ResourceNotFoundException, KeyError):
+            return True
+        time.sleep(delay)
+
+    logger.warning(
+        "Schedule group %s still present after %ss", schedule_group, sum(SCHEDULE_GROUP_BACKOFF)
+    )
+    return False
+
+
+def list_schedule_names(scheduler, schedule_group):
     """
+    List the names of all schedules in a schedule group
+    """
+    paginator = scheduler.get_paginator("list_schedules")
+
     try:
-        scheduler.create_schedule_group(Name=schedule_group)
-        print(f"Created schedule group: {schedule_group}")
-    except scheduler.exceptions.ConflictException:
-        print(f"Schedule group {schedule_group} already exists - continuing")
-    except Exception as e:
-        print(f"Error creating schedule group: {str(e)}")
-        raise
+        return [
+            schedule["Name"]
+            for page in paginator.paginate(GroupName=schedule_group)
+            for schedule in page.get("Schedules", [])
+        ]
+    except (scheduler.exceptions.ResourceNotFoundException, KeyError):
+        return []
 
 
-def clear_event_bridge_schedules():
+def delete_schedule(scheduler, schedule_group, schedule_name):
+    """
+    Delete a single schedule, ignoring schedules that are already gone
+    """
+    try:
+        scheduler.delete_schedule(Name=schedule_name, GroupName=schedule_group)
+    except scheduler.exceptions.ResourceNotFoundException:
+        pass
+
+
+def clear_event_bridge_schedules(schedule_group):
     """
     Delete all existing EventBridge schedules from our schedule group
+
+    Schedules are deleted individually in parallel, which avoids waiting for a
+    group deletion to propagate. Very large groups are deleted and recreated.
     """
-    scheduler = boto3.client("scheduler")
-    schedule_group = os.environ.get("SCHEDULE_GROUP_NAME", "ical-notifications")
+    scheduler = _scheduler()
+
+    schedule_names = list_schedule_names(scheduler, schedule_group)
+
+    if len(schedule_names) > SCHEDULE_GROUP_RECREATE_THRESHOLD:
+        return recreate_schedule_group(scheduler, schedule_group)
 
+    if schedule_names:
+        with ThreadPoolExecutor(max_workers=MAX_SCHEDULER_WORKERS) as executor:
+            futures = [
+                executor.submit(delete_schedule, scheduler, schedule_group, name)
+                for name in schedule_names
+            ]
+            for future in as_completed(futures):
+                future.result()
+        logger.info("Deleted %d schedules from group: %s", len(schedule_names), schedule_group)
+
+    # Make sure the group exists for new schedules
+    ensure_schedule_group_exists(scheduler, schedule_group)
+    return True
+
+
+def recreate_schedule_group(scheduler, schedule_group):
+    """
+    Delete the whole schedule group (and its schedules) and recreate it empty
+    """
     try:
         # Delete the entire group (deletes all schedules)
         scheduler.delete_schedule_group(Name=schedule_group)
-        print(f"Deleted schedule group: {schedule_group}")
+        logger.info("Deleted schedule group: %s", schedule_group)
 
         # Wait for deletion to complete (EventBridge group deletion is async)
-        import time
-        print("Waiting 30 seconds for schedule group deletion to complete...")
-        time.sleep(30)
+        wait_for_schedule_group_deletion(scheduler, schedule_group)
 
         # Recreate the empty group for new schedules
-        ensure_schedule_group_exists(scheduler, schedule_group)
+        ensure_schedule_group_exists(scheduler, schedule_group, retry_on_conflict=True)
 
         return True
 
     except (scheduler.exceptions.ResourceNotFoundException, KeyError):
         # Schedule group doesn't exist - create new one
         # Note: KeyError is caught for moto compatibility (moto throws KeyError instead of ResourceNotFoundException)
-        print("Schedule group doesn't exist - creating new one")
+        logger.info("Schedule group doesn't exist - creating new one")
         ensure_schedule_group_exists(scheduler, schedule_group)
         return True
 
 
+def iter_delete_batches(s3_client, bucket_name):
+    """
+    Yield the bucket's keys as delete_objects batches, one per listing page
+
+    Each page holds at most 1000 keys, which is exactly the delete_objects limit.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name):
+        batch = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+        if batch:
+            yield batch
+
+
 def clear_bucket(bucket_name):
     """
     Delete all files from the S3 bucket
     """
-    s3 = boto3.resource("s3")
-    bucket = s3.Bucket(bucket_name)
+    s3 = _s3()
 
     try:
-        # Count objects before deletion
-        object_count = sum(1 for _ in bucket.objects.all())
-
-        if object_count == 0:
-            print("Bucket already empty")
+        # Batches are deleted concurrently while the next page is being listed, and
+        # counted as they are deleted so no separate counting pass is needed.
+        # Quiet mode keeps responses small: only keys that failed are listed.
+        object_count = 0
+        failed_count = 0
+        retry_attempts = 0
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    s3.delete_objects,
+                    Bucket=bucket_name,
+                    Delete={"Objects": batch, "Quiet": True},
+                ): len(batch)
+                for batch in iter_delete_batches(s3, bucket_name)
+            }
+
+            for future in as_completed(futures):
+                response = future.result()
+                errors = response.get("Errors", [])
+                for error in errors:
+                    logger.error(
+                        "Failed to delete %s: %s", error.get("Key"), error.get("Message")
+                    )
+                object_count += futures[future] - len(errors)
+                failed_count += len(errors)
+                retry_attempts += response["ResponseMetadata"].get("RetryAttempts", 0)
+
+        if retry_attempts:
+            logger.warning("delete_objects was throttled and retried %d times", retry_attempts)
+
+        if failed_count:
+            logger.warning("Failed to delete %d files from bucket", failed_count)
+
+        if object_count == 0 and failed_count == 0:
+            logger.info("Bucket already empty")
             return 0
 
-        # Delete all objects - handles pagination automatically
-        bucket.objects.all().delete()
-
-        print(f"Deleted {object_count} files from bucket")
+        logger.info("Deleted %d files from bucket", object_count)
         return object_count
 
     except Exception as e:
-        print(f"Error clearing bucket: {str(e)}")
+        logger.error("Error clearing bucket: %s", e)
         raise
 
 
 def decode_zip_file(zip_file_b64):
     """
-    Decode base64 zip file and return BytesIO buffer
+    Decode base64 zip file and return a seekable binary file object
+
+    binascii decodes the ASCII str directly - base64.b64decode() would first copy
+    the whole payload into an intermediate bytes object. Small payloads go into a
+    BytesIO, which shares the decoded buffer rather than copying it. Large ones are
+    decoded chunk by chunk into a temporary file, so the decoded zip never sits in
+    memory next to the payload. The caller should close the returned file.
     """
-    zip_data = base64.b64decode(zip_file_b64)
-    return io.BytesIO(zip_data)
+    if len(zip_file_b64) // 4 * 3 <= ZIP_SPOOL_THRESHOLD:
+        return io.BytesIO(binascii.a2b_base64(zip_file_b64))
+
+    # Line breaks would shift the chunk boundaries off the 4-character quanta
+    if BASE64_WHITESPACE_RE.search(zip_file_b64):
+        zip_file_b64 = BASE64_WHITESPACE_RE.sub("", zip_file_b64)
+
+    # A plain TemporaryFile rather than SpooledTemporaryFile: the latter has no
+    # seekable() before Python 3.11, which zipfile needs to open members
+    zip_buffer = tempfile.TemporaryFile()
+    for start in range(0, len(zip_file_b64), ZIP_DECODE_CHUNK_SIZE):
+        zip_buffer.write(binascii.a2b_base64(zip_file_b64[start:start + ZIP_DECODE_CHUNK_SIZE]))
+    zip_buffer.seek(0)
+    return zip_buffer
 
 
 def extract_ical_files_from_zip(zip_buffer):
     """
-    Extract .ics files from zip buffer and return list of (filename, content) tuples
+    Open a zip buffer and return (ZipFile, list of .ics ZipInfo entries)
+
+    The central directory is read once here and the filtered entries are passed
+    around from then on. Entries are opened from the returned ZipFile as they
+    are needed, so calendars stream to S3 rather than sitting in memory. The
+    caller owns the ZipFile and should close it (e.g. with a with block).
     """
-    ical_files = []
+    zip_ref = zipfile.ZipFile(zip_buffer)
+    return zip_ref, list_ical_entries(zip_ref)
 
-    with zipfile.ZipFile(zip_buffer) as zip_ref:
-        for filename in zip_ref.namelist():
-            if filename.endswith(".ics") and not filename.endswith("/"):
-                ical_content = zip_ref.read(filename)
-                ical_files.append((filename, ical_content))
 
-    return ical_files
+def list_ical_entries(zip_ref):
+    """
+    List the .ics file entries (skipping directories) in an open zip file
+    """
+    return [
+        info
+        for info in zip_ref.infolist()
+        if not info.is_dir() and info.filename.endswith(".ics")
+    ]
 
 
 def upload_ical_file_to_s3(s3_client, content, bucket_name, filename):
     """
     Upload a single iCal file to S3
+
+    content can be raw bytes or a readable file-like object (e.g. an open zip entry)
     """
-    file_buffer = io.BytesIO(content)
+    if isinstance(content, (bytes, bytearray)):
+        file_buffer = io.BytesIO(content)
+    else:
+        file_buffer = content
     s3_client.upload_fileobj(
         file_buffer,
         bucket_name,
@@ -251,25 +642,39 @@ def upload_ical_file_to_s3(s3_client, content, bucket_name, filename):
     )
 
 
-def extract_and_upload_calendars(zip_file_b64, bucket_name):
+def upload_zip_entry_to_s3(s3_client, ical_file, bucket_name, filename):
     """
-    Extract .ics files from base64 zip and upload to S3 using streaming
+    Upload an open zip entry to S3 and close it
     """
-    s3 = boto3.client("s3")
+    with ical_file:
+        upload_ical_file_to_s3(s3_client, ical_file, bucket_name, filename)
 
-    # Decode base64 zip file
-    zip_buffer = decode_zip_file(zip_file_b64)
 
-    # Extract iCal files from zip
-    ical_files_data = extract_ical_files_from_zip(zip_buffer)
+def extract_and_upload_calendars(zip_ref, ical_entries, bucket_name):
+    """
+    Upload the given .ics entries of an open zip file to S3 using streaming
+    """
+    s3 = _s3()
 
-    # Upload each file to S3
+    # Stream each .ics entry from the zip straight to S3, rather than reading
+    # every file into memory and copying it into another buffer for upload.
+    # Small PUTs are latency-bound, so uploads run concurrently; entries are
+    # opened here and read on the workers (zipfile serialises the shared reads).
     uploaded_files = []
-    for filename, content in ical_files_data:
-        upload_ical_file_to_s3(s3, content, bucket_name, filename)
-        uploaded_files.append(filename)
-        print(f"Uploaded {filename} to S3")
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                upload_zip_entry_to_s3, s3, zip_ref.open(info), bucket_name, info.filename
+            ): info.filename
+            for info in ical_entries
+        }
 
+        for future in as_completed(futures):
+            future.result()
+            uploaded_files.append(futures[future])
+            logger.debug("Uploaded %s to S3", futures[future])
+
+    logger.info("Uploaded %d calendar files to S3", len(uploaded_files))
     return uploaded_files
 
 
@@ -277,73 +682,163 @@ def list_ical_files_in_bucket(s3_client, bucket_name):
     """
     List all .ics files in S3 bucket
     """
-    response = s3_client.list_objects_v2(Bucket=bucket_name)
-
-    if 'Contents' not in response:
-        return []
-
-    ical_files = []
-    for obj in response['Contents']:
-        filename = obj.get('Key')
-        if filename and filename.endswith('.ics'):
-            ical_files.append(filename)
+    # A single list_objects_v2 call returns at most 1000 keys - paginate to see them all
+    paginator = s3_client.get_paginator('list_objects_v2')
 
-    return ical_files
+    return [
+        obj['Key']
+        for page in paginator.paginate(Bucket=bucket_name)
+        for obj in page.get('Contents', [])
+        if obj['Key'].endswith('.ics')
+    ]
 
 
 def download_ical_content(s3_client, bucket_name, filename):
     """
     Download iCal file content from S3
+
+    Small files are read in one go. Larger files are streamed into a bytearray
+    pre-sized from ContentLength - a plain read() briefly holds the body twice.
+    Either way the raw bytes are returned; get_upcoming_events decodes them.
     """
     file_response = s3_client.get_object(Bucket=bucket_name, Key=filename)
-    return file_response['Body'].read()
+    body = file_response['Body']
+    content_length = file_response.get('ContentLength') or 0
+
+    if content_length <= STREAMING_DOWNLOAD_THRESHOLD:
+        return body.read()
+
+    buffer = bytearray(content_length)
+    offset = 0
+    with memoryview(buffer) as view:
+        for chunk in body.iter_chunks(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+    return buffer
 
 
-def create_schedules_for_events(events, schedule_group):
+def create_schedules_for_events(scheduler, events, schedule_group, config):
     """
-    Create EventBridge schedules for a list of events
+    Create EventBridge schedules for a list of events in parallel
+
+    config is the get_schedule_configuration() tuple, read once by the caller.
+    Returns (schedules created, schedules that failed); events skipped as past
+    count as neither.
     """
+    if not events:
+        return 0, 0
+
+    # Every event in the batch is checked against the same "now"
+    now_ts = datetime.now(tz=timezone.utc).timestamp()
+
     schedules_created = 0
-    for event in events:
-        create_event_schedule(event, schedule_group)
-        schedules_created += 1
-    return schedules_created
+    failures = 0
+    with ThreadPoolExecutor(max_workers=MAX_SCHEDULER_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                create_event_schedule, event, schedule_group, scheduler, config, now_ts
+            )
+            for event in events
+        ]
 
+        # A single failed schedule shouldn't abort the rest of the batch;
+        # create_event_schedule already logs the failure details
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    schedules_created += 1
+            except Exception:
+                failures += 1
 
-def process_calendars_and_create_schedules(bucket_name, schedule_group):
+    if failures:
+        logger.warning("Failed to create %d of %d schedules", failures, len(events))
+
+    return schedules_created, failures
+
+
+def process_calendars_and_create_schedules(bucket_name, schedule_group, config):
     """
     Download calendar files from S3, extract events, and create schedules
+
+    config is the get_schedule_configuration() tuple, read once by the caller.
+    Returns (events found, schedules created, schedules that failed).
     """
-    s3 = boto3.client("s3")
+    _, _, notification_minutes, fallback_timezone = config
+
+    s3 = _s3()
+    scheduler = _scheduler()
 
     # List all .ics files in bucket
     ical_files = list_ical_files_in_bucket(s3, bucket_name)
 
     if not ical_files:
-        print("No calendar files found in bucket")
-        return 0
-
-    total_events = 0
-
-    for filename in ical_files:
-        # Download file content
-        ical_content = download_ical_content(s3, bucket_name, filename)
+        logger.info("No calendar files found in bucket")
+        return 0, 0, 0
+
+    # Overlapping exports often repeat the same event across files. Events that
+    # map to the same schedule name (UID + start) would only fail with a
+    # ConflictException, so skip them before they cost a CreateSchedule call.
+    seen_schedule_names = set()
+    duplicates = 0
+    upcoming_events = []
 
-        # Extract upcoming events
-        events = get_upcoming_events(ical_content, days_ahead=7)
+    # Download all files concurrently - S3 GETs are network-bound so threads overlap
+    # well, and the boto3 client is thread-safe. Schedule creation is kept out of
+    # this pool since it mutates AWS state and has its own rate limits.
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(ical_files))) as executor:
+        downloads = {
+            executor.submit(download_ical_content, s3, bucket_name, filename): filename
+            for filename in ical_files
+        }
 
-        # Create EventBridge schedules for each event
-        schedules_created = create_schedules_for_events(events, schedule_group)
+        for future in as_completed(downloads):
+            # Popping the future frees its calendar body once its events are extracted,
+            # instead of holding every download until the pool exits
+            filename = downloads.pop(future)
+            ical_content = future.result()
+
+            # Extract upcoming events
+            events = get_upcoming_events(
+                ical_content,
+                days_ahead=7,
+                notification_minutes=notification_minutes,
+                fallback_timezone=fallback_timezone,
+            )
+
+            unique_events = []
+            for event in events:
+                schedule_name = generate_schedule_name(event)
+                if schedule_name in seen_schedule_names:
+                    duplicates += 1
+                    continue
+                seen_schedule_names.add(schedule_name)
+                unique_events.append(event)
+
+            upcoming_events.extend(unique_events)
+            logger.info("Processed %s: %d events found", filename, len(unique_events))
+
+    # Create EventBridge schedules for every calendar in one pool, so a file with
+    # few events doesn't leave workers idle while the next file waits its turn
+    schedules_created, schedules_failed = create_schedules_for_events(
+        scheduler, upcoming_events, schedule_group, config
+    )
 
-        total_events += len(events)
-        print(f"Processed {filename}: {len(events)} events found")
+    if duplicates:
+        logger.info("Skipped %d duplicate events across calendar files", duplicates)
 
-    return total_events
+    return len(upcoming_events), schedules_created, schedules_failed
 
 
+@functools.lru_cache(maxsize=1)
 def get_schedule_configuration():
     """
     Get schedule configuration from environment variables
+
+    Lambda environment variables are fixed for the life of the container, so the
+    parsed configuration is cached; a missing-variable error is not. The fallback
+    timezone is resolved here, so a bad FALLBACK_TIMEZONE fails the invocation
+    before any schedules or files are deleted.
     """
     notification_lambda_arn = os.environ.get('NOTIFICATION_LAMBDA_ARN')
     scheduler_role_arn = os.environ.get('SCHEDULER_ROLE_ARN')
@@ -353,6 +848,11 @@ def get_schedule_configuration():
     if not notification_lambda_arn or not scheduler_role_arn:
         raise ValueError("NOTIFICATION_LAMBDA_ARN and SCHEDULER_ROLE_ARN environment variables are required")
 
+    try:
+        _tz(fallback_timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"FALLBACK_TIMEZONE is not a valid timezone: {fallback_timezone}")
+
     return notification_lambda_arn, scheduler_role_arn, notification_minutes, fallback_timezone
 
 
@@ -373,19 +873,28 @@ def calculate_notification_time(event_time, minutes_before):
 def build_schedule_payload(event):
     """
     Build the JSON payload for the schedule target
+
+    The schema is fixed, so only the free-text fields go through json.dumps (to
+    escape quotes and control characters); the rest is a plain string template.
     """
-    return json.dumps({
-        'event_summary': event['summary'],
-        'event_location': event['location'],
-        'event_time': event['start_datetime'].isoformat(),
-        'notification_type': 'calendar_reminder'
-    })
+    summary = json.dumps(event['summary'])
+    location = json.dumps(event['location'])
+    event_time = event['start_datetime'].isoformat()
+    return (
+        f'{{"event_summary":{summary},"event_location":{location},'
+        f'"event_time":"{event_time}","notification_type":"calendar_reminder"}}'
+    )
 
 
-def create_event_schedule(event, schedule_group):
+def create_event_schedule(event, schedule_group, scheduler=None, config=None, now_ts=None):
     """
     Create an EventBridge schedule for a single calendar event.
 
+    Returns the schedule name, or None if the event was skipped. A shared
+    scheduler client, the get_schedule_configuration() tuple and the current
+    UTC timestamp can be passed in so batch callers don't rebuild them for
+    every event.
+
     CRITICAL TIMEZONE BUG FIX:
     ==========================
     This function handles a common timezone issue in calendar applications:
@@ -401,12 +910,16 @@ def create_event_schedule(event, schedule_group):
     - Comparison: 9:15 <= 23:49 = False (incorrectly thinks event is future)
     - Reality: 9:15 AM Melbourne = 11:15 PM UTC (already passed!)
 
-    Solution: Convert naive times to user's timezone, then to UTC for comparison.
+    Solution: Interpret naive times in the user's timezone, then compare absolute
+    (UTC) timestamps.
     """
-    scheduler = boto3.client("scheduler")
+    if scheduler is None:
+        scheduler = _scheduler()
 
     # Get configuration
-    notification_lambda_arn, scheduler_role_arn, notification_minutes, fallback_timezone = get_schedule_configuration()
+    if config is None:
+        config = get_schedule_configuration()
+    notification_lambda_arn, scheduler_role_arn, notification_minutes, fallback_timezone = config
 
     # Generate unique schedule name
     schedule_name = generate_schedule_name(event)
@@ -414,11 +927,6 @@ def create_event_schedule(event, schedule_group):
     # Calculate notification time
     notification_time = calculate_notification_time(event['start_datetime'], notification_minutes)
 
-    # DEBUG: Log all time-related info
-    print(f"=== DEBUG: Time validation for {event['summary']} ===")
-    print(f"Event start time: {event['start_datetime']} (tzinfo: {event['start_datetime'].tzinfo})")
-    print(f"Notification time: {notification_time} (tzinfo: {notification_time.tzinfo})")
-
     # TIMEZONE HANDLING DOCUMENTATION:
     # ================================
     # Calendar events can have three types of datetime information:
@@ -435,41 +943,34 @@ def create_event_schedule(event, schedule_group):
     # Python treats them as the same timezone and thinks 9:15 AM is "future"
     # when it's actually 34 minutes in the past!
     #
-    # Solution: Convert naive times to the user's timezone, then to UTC for comparison.
+    # Solution: Interpret naive times in the user's timezone, then compare absolute
+    # POSIX timestamps - no timezone conversion of the datetime itself is needed.
 
     # Validate notification time is in the future
+    if now_ts is None:
+        now_ts = datetime.now(tz=timezone.utc).timestamp()
+
     if notification_time.tzinfo:
-        # Case 1: Timezone-aware notification time
-        # Compare directly with UTC (both have timezone info)
-        current_time = datetime.now(tz=pytz.UTC)
-        print(f"Using timezone-aware comparison with UTC: {current_time}")
+        # Case 1: Timezone-aware notification time - timestamp() is already absolute
+        notification_ts = notification_time.timestamp()
     else:
         # Case 2: Naive notification time (no timezone info)
-        # Assume it's in the user's local timezone and convert to UTC for comparison
+        # Assume it's in the user's local timezone before taking the timestamp
         # This follows the "principle of least surprise" - users expect naive times
         # to be in their local timezone, not UTC
-        fallback_tz = pytz.timezone(fallback_timezone)
-
-        # Step 1: Localize naive time to user's timezone
-        notification_time_tz = fallback_tz.localize(notification_time)
-
-        # Step 2: Convert to UTC for comparison with Lambda's current time
-        notification_time_utc = notification_time_tz.astimezone(pytz.UTC)
-        current_time = datetime.now(tz=pytz.UTC)
+        notification_ts = notification_time.replace(tzinfo=_tz(fallback_timezone)).timestamp()
 
-        print(f"Converted naive time {notification_time} ({fallback_timezone}) to UTC: {notification_time_utc}")
-        print(f"Current time (UTC): {current_time}")
+    is_past = notification_ts <= now_ts
 
-        # Update notification_time for the comparison
-        notification_time = notification_time_utc
-
-    print(f"Comparison: {notification_time} <= {current_time} = {notification_time <= current_time}")
+    # One record per event: start, notification time, decision
+    logger.debug(
+        "%s: start=%s notification=%s -> %s",
+        event['summary'], event['start_datetime'], notification_time,
+        "skip" if is_past else "schedule",
+    )
 
-    if notification_time <= current_time:
-        print(f"✅ SKIPPING past event: {event['summary']} (notification time: {notification_time})")
+    if is_past:
         return
-    else:
-        print(f"⚠️ SCHEDULING future event: {event['summary']} (notification time: {notification_time})")
 
     # Create schedule expression with proper timezone handling
     #
@@ -490,7 +991,7 @@ def create_event_schedule(event, schedule_group):
         schedule_expression = f"at({naive_time.strftime('%Y-%m-%dT%H:%M:%S')})"
         schedule_timezone = timezone_name
     else:
-        # No timezone info - apply fallback timezone
+        # No timezone info - the naive time is in the fallback timezone
         schedule_expression = f"at({notification_time.strftime('%Y-%m-%dT%H:%M:%S')})"
         schedule_timezone = fallback_timezone
 
@@ -511,8 +1012,12 @@ def create_event_schedule(event, schedule_group):
             FlexibleTimeWindow={'Mode': 'OFF'}
         )
 
-        print(f"Created schedule: {schedule_name} at {schedule_expression} in {schedule_timezone}")
+        logger.debug(
+            "Created schedule: %s at %s in %s",
+            schedule_name, schedule_expression, schedule_timezone,
+        )
+        return schedule_name
 
     except Exception as e:
-        print(f"Failed to create schedule for {event['summary']}: {str(e)}")
+        logger.error("Failed to create schedule for %s: %s", event['summary'], e)
         raise
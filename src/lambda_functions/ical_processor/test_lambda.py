@@ -8,9 +8,13 @@ import boto3
 import pytz
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from moto import mock_aws
+import lambda_function
 from lambda_function import (
     get_upcoming_events,
+    prefilter_ical_text,
     validate_environment_variables,
     validate_event_payload,
     decode_zip_file,
@@ -23,9 +27,51 @@ from lambda_function import (
     build_schedule_payload,
     get_schedule_configuration,
     create_event_schedule,
+    clear_event_bridge_schedules,
+    clear_bucket,
+    ensure_schedule_group_exists,
+    wait_for_schedule_group_deletion,
+    SCHEDULE_GROUP_BACKOFF,
     lambda_handler
 )
 
+HANDLER_ENV = {
+    'S3_BUCKET_NAME': 'test-bucket',
+    'SCHEDULE_GROUP_NAME': 'test-group',
+    'NOTIFICATION_LAMBDA_ARN': 'arn:aws:lambda:us-east-1:123456789012:function:notify',
+    'SCHEDULER_ROLE_ARN': 'arn:aws:iam::123456789012:role/scheduler'
+}
+
+
+def make_ical(uid, start, summary='Test Meeting'):
+    """Build a single-event calendar starting at the given UTC datetime"""
+    return f"""BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+DTSTART:{start.strftime("%Y%m%dT%H%M%SZ")}
+SUMMARY:{summary}
+UID:{uid}
+END:VEVENT
+END:VCALENDAR"""
+
+
+def make_zip_payload(files):
+    """Zip {filename: content} and base64-encode it as a handler event payload"""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w') as zf:
+        for filename, content in files.items():
+            zf.writestr(filename, content)
+    return {'zip_file': base64.b64encode(zip_buffer.getvalue()).decode('utf-8')}
+
+
+@pytest.fixture(autouse=True)
+def clear_schedule_configuration_cache():
+    """Each test sets its own environment, so don't reuse a cached configuration"""
+    get_schedule_configuration.cache_clear()
+    yield
+    get_schedule_configuration.cache_clear()
+
 class TestICalProcessing:
     """Test suite for iCal processing functionality"""
 
@@ -169,6 +215,82 @@ END:VCALENDAR"""
         events_1day = get_upcoming_events(test_ical, days_ahead=1)
         assert len(events_1day) == 0
 
+    def test_events_inside_notification_lead_time_filtered_out(self):
+        """Test that events whose notification time has passed are not included"""
+        soon = datetime.now(tz=pytz.UTC) + timedelta(minutes=10)
+        later = datetime.now(tz=pytz.UTC) + timedelta(hours=2)
+
+        test_ical = f"""BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+DTSTART:{soon.strftime("%Y%m%dT%H%M%SZ")}
+SUMMARY:Starting Soon
+UID:soon-001@example.com
+END:VEVENT
+BEGIN:VEVENT
+DTSTART:{later.strftime("%Y%m%dT%H%M%SZ")}
+SUMMARY:Later Today
+UID:later-001@example.com
+END:VEVENT
+END:VCALENDAR"""
+
+        events = get_upcoming_events(test_ical, days_ahead=7, notification_minutes=15)
+
+        assert len(events) == 1
+        assert events[0]['summary'] == 'Later Today'
+
+    def test_prefilter_drops_one_off_events_outside_window(self):
+        """Test that the text prefilter drops stale one-off events but keeps recurring ones"""
+        now = datetime.now(tz=pytz.UTC)
+        soon = now + timedelta(days=1)
+
+        test_ical = f"""BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+DTSTART:20200101T100000Z
+SUMMARY:Old One-Off
+END:VEVENT
+BEGIN:VEVENT
+DTSTART:20200101T100000Z
+RRULE:FREQ=DAILY
+SUMMARY:Old Recurring
+END:VEVENT
+BEGIN:VEVENT
+DTSTART:{soon.strftime("%Y%m%dT%H%M%SZ")}
+SUMMARY:Tomorrow
+END:VEVENT
+END:VCALENDAR"""
+
+        filtered = prefilter_ical_text(test_ical, now, now + timedelta(days=7))
+
+        assert 'Old One-Off' not in filtered
+        assert 'Old Recurring' in filtered
+        assert 'Tomorrow' in filtered
+        assert filtered.startswith('BEGIN:VCALENDAR')
+
+    def test_recurring_event_started_in_past_still_found(self):
+        """Test that a recurring series that began long ago still yields upcoming occurrences"""
+        start = (datetime.now(tz=pytz.UTC) - timedelta(days=30)).replace(
+            hour=23, minute=0, second=0, microsecond=0
+        )
+
+        test_ical = f"""BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//Test//EN
+BEGIN:VEVENT
+DTSTART:{start.strftime("%Y%m%dT%H%M%SZ")}
+RRULE:FREQ=DAILY
+SUMMARY:Daily Standup
+UID:daily-001@example.com
+END:VEVENT
+END:VCALENDAR"""
+
+        events = get_upcoming_events(test_ical, days_ahead=7)
+
+        assert len(events) >= 6
+        assert all(event['summary'] == 'Daily Standup' for event in events)
+
 
 class TestValidation:
     """Test validation functions"""
@@ -229,6 +351,24 @@ class TestZipProcessing:
         assert isinstance(result, io.BytesIO)
         assert result.getvalue() == zip_data
 
+    def test_decode_large_zip_file_to_temp_file(self):
+        """Test that zips above the spool threshold are decoded in chunks to a file"""
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zf:
+            zf.writestr('calendar1.ics', 'BEGIN:VCALENDAR\nEND:VCALENDAR' * 50)
+
+        # Encode with line breaks, as some clients do
+        zip_data = zip_buffer.getvalue()
+        zip_b64 = base64.encodebytes(zip_data).decode('utf-8')
+
+        with patch('lambda_function.ZIP_SPOOL_THRESHOLD', 100), \
+                patch('lambda_function.ZIP_DECODE_CHUNK_SIZE', 8):
+            result = decode_zip_file(zip_b64)
+
+        with result:
+            assert not isinstance(result, io.BytesIO)
+            assert result.read() == zip_data
+
     def test_extract_ical_files_from_zip(self):
         """Test extracting .ics files from zip"""
         # Create test zip with .ics files
@@ -241,10 +381,13 @@ class TestZipProcessing:
 
         zip_buffer.seek(0)
 
-        ical_files = extract_ical_files_from_zip(zip_buffer)
+        zip_ref, ical_entries = extract_ical_files_from_zip(zip_buffer)
+        with zip_ref:
+            ical_files = {info.filename: zip_ref.read(info) for info in ical_entries}
 
         assert len(ical_files) == 2
-        filenames = [f[0] for f in ical_files]
+        assert ical_files['calendar1.ics'] == b'BEGIN:VCALENDAR\nEND:VCALENDAR'
+        filenames = list(ical_files)
         assert 'calendar1.ics' in filenames
         assert 'calendar2.ics' in filenames
         assert 'readme.txt' not in filenames
@@ -264,6 +407,23 @@ class TestZipProcessing:
         assert response['Body'].read() == content
         assert response['ContentType'] == 'text/calendar'
 
+    @mock_aws
+    def test_upload_ical_file_to_s3_from_stream(self):
+        """Test uploading an iCal file straight from an open zip entry"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+
+        content = b'BEGIN:VCALENDAR\nEND:VCALENDAR'
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zf:
+            zf.writestr('test.ics', content)
+
+        with zipfile.ZipFile(zip_buffer) as zf, zf.open('test.ics') as ical_file:
+            upload_ical_file_to_s3(s3, ical_file, 'test-bucket', 'test.ics')
+
+        response = s3.get_object(Bucket='test-bucket', Key='test.ics')
+        assert response['Body'].read() == content
+
 
 class TestS3Operations:
     """Test S3-related functions"""
@@ -296,6 +456,50 @@ class TestS3Operations:
         files = list_ical_files_in_bucket(s3, 'empty-bucket')
         assert files == []
 
+    @mock_aws
+    def test_list_ical_files_in_bucket_paginates(self):
+        """Test listing returns .ics files beyond the first 1000 keys"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+
+        for i in range(1005):
+            s3.put_object(Bucket='test-bucket', Key=f'calendar{i:04d}.ics', Body=b'test')
+
+        files = list_ical_files_in_bucket(s3, 'test-bucket')
+
+        assert len(files) == 1005
+        assert 'calendar1004.ics' in files
+
+    @mock_aws
+    def test_clear_bucket_deletes_every_page(self):
+        """Test emptying a bucket with more keys than one delete_objects batch"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+
+        for i in range(1005):
+            s3.put_object(Bucket='test-bucket', Key=f'calendar{i:04d}.ics', Body=b'test')
+
+        assert clear_bucket('test-bucket') == 1005
+        assert s3.list_objects_v2(Bucket='test-bucket')['KeyCount'] == 0
+
+    @mock_aws
+    def test_clear_bucket_reports_failed_keys(self, caplog):
+        """Test keys listed in a delete_objects Errors entry are logged and not counted"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+        s3.put_object(Bucket='test-bucket', Key='a.ics', Body=b'test')
+        s3.put_object(Bucket='test-bucket', Key='b.ics', Body=b'test')
+
+        response = {
+            'Errors': [{'Key': 'b.ics', 'Code': 'AccessDenied', 'Message': 'Access Denied'}],
+            'ResponseMetadata': {'RetryAttempts': 0},
+        }
+        with patch.object(lambda_function._s3(), 'delete_objects', return_value=response):
+            assert clear_bucket('test-bucket') == 1
+
+        assert 'Failed to delete b.ics: Access Denied' in caplog.text
+        assert 'Failed to delete 1 files from bucket' in caplog.text
+
     @mock_aws
     def test_download_ical_content(self):
         """Test downloading iCal content from S3"""
@@ -308,6 +512,22 @@ class TestS3Operations:
         content = download_ical_content(s3, 'test-bucket', 'test.ics')
         assert content == test_content
 
+    @mock_aws
+    def test_download_ical_content_large_file_streamed(self):
+        """Test large iCal files are streamed into a buffer and returned undecoded"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+
+        test_content = 'BEGIN:VCALENDAR\nSUMMARY:Café ☕\nEND:VCALENDAR'
+        s3.put_object(Bucket='test-bucket', Key='test.ics', Body=test_content.encode('utf-8'))
+
+        with patch('lambda_function.STREAMING_DOWNLOAD_THRESHOLD', 10), \
+                patch('lambda_function.DOWNLOAD_CHUNK_SIZE', 4):
+            content = download_ical_content(s3, 'test-bucket', 'test.ics')
+
+        assert isinstance(content, bytearray)
+        assert content == test_content.encode('utf-8')
+
 
 class TestScheduleUtilities:
     """Test schedule-related utility functions"""
@@ -349,6 +569,20 @@ class TestScheduleUtilities:
         assert payload_data['event_time'] == '2023-12-25T10:00:00'
         assert payload_data['notification_type'] == 'calendar_reminder'
 
+    def test_build_schedule_payload_escapes_text(self):
+        """Test that quotes and newlines in free-text fields produce valid JSON"""
+        event = {
+            'summary': 'Say "hi"\nto Zoë',
+            'location': 'Room \\ 4',
+            'start_datetime': datetime(2023, 12, 25, 10, 0, 0, tzinfo=pytz.UTC)
+        }
+
+        payload_data = json.loads(build_schedule_payload(event))
+
+        assert payload_data['event_summary'] == 'Say "hi"\nto Zoë'
+        assert payload_data['event_location'] == 'Room \\ 4'
+        assert payload_data['event_time'] == '2023-12-25T10:00:00+00:00'
+
     def test_get_schedule_configuration_success(self):
         """Test successful schedule configuration retrieval"""
         with patch.dict(os.environ, {
@@ -533,6 +767,108 @@ END:VCALENDAR"""
         # The recurring_ical_events library should handle timezone conversion
 
 
+def create_test_schedules(scheduler, schedule_group, count):
+    """Create count one-off schedules in the group"""
+    for i in range(count):
+        scheduler.create_schedule(
+            Name=f'event-{i}',
+            GroupName=schedule_group,
+            ScheduleExpression='at(2030-01-01T00:00:00)',
+            Target={'Arn': HANDLER_ENV['NOTIFICATION_LAMBDA_ARN'],
+                    'RoleArn': HANDLER_ENV['SCHEDULER_ROLE_ARN']},
+            FlexibleTimeWindow={'Mode': 'OFF'}
+        )
+
+
+class TestScheduleClearing:
+    """Test clearing the EventBridge schedule group"""
+
+    @mock_aws
+    def test_clear_schedules_empties_existing_group(self):
+        """Test that every schedule is deleted and the group itself is kept"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        scheduler.create_schedule_group(Name='test-group')
+        create_test_schedules(scheduler, 'test-group', 5)
+
+        assert clear_event_bridge_schedules('test-group') is True
+
+        assert scheduler.list_schedules(GroupName='test-group')['Schedules'] == []
+        assert scheduler.get_schedule_group(Name='test-group')['Name'] == 'test-group'
+
+    @mock_aws
+    def test_clear_schedules_creates_missing_group(self):
+        """Test that a schedule group that doesn't exist yet is created"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+
+        assert clear_event_bridge_schedules('test-group') is True
+
+        assert scheduler.get_schedule_group(Name='test-group')['Name'] == 'test-group'
+
+    @mock_aws
+    def test_clear_schedules_recreates_large_group(self):
+        """Test that a group over the threshold is deleted and recreated empty"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        scheduler.create_schedule_group(Name='test-group')
+        create_test_schedules(scheduler, 'test-group', 3)
+
+        with patch('lambda_function.SCHEDULE_GROUP_RECREATE_THRESHOLD', 0), \
+                patch('lambda_function.delete_schedule') as mock_delete, \
+                patch('lambda_function.time.sleep'):
+            assert clear_event_bridge_schedules('test-group') is True
+
+        # The group was dropped wholesale rather than schedule by schedule
+        mock_delete.assert_not_called()
+        assert scheduler.list_schedules(GroupName='test-group')['Schedules'] == []
+        assert scheduler.get_schedule_group(Name='test-group')['Name'] == 'test-group'
+
+
+    def test_wait_for_schedule_group_deletion(self):
+        """Test polling backs off until the deleted group is gone"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        with Stubber(scheduler) as stubber, patch('lambda_function.time.sleep') as mock_sleep:
+            stubber.add_response('get_schedule_group', {'Name': 'test-group', 'State': 'DELETING'})
+            stubber.add_client_error('get_schedule_group', 'ResourceNotFoundException')
+
+            assert wait_for_schedule_group_deletion(scheduler, 'test-group') is True
+            stubber.assert_no_pending_responses()
+
+        mock_sleep.assert_called_once_with(SCHEDULE_GROUP_BACKOFF[0])
+
+    def test_wait_for_schedule_group_deletion_gives_up(self):
+        """Test polling stops after the backoff when the group never goes away"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        with Stubber(scheduler) as stubber, patch('lambda_function.time.sleep'):
+            for _ in SCHEDULE_GROUP_BACKOFF:
+                stubber.add_response(
+                    'get_schedule_group', {'Name': 'test-group', 'State': 'DELETING'}
+                )
+
+            assert wait_for_schedule_group_deletion(scheduler, 'test-group') is False
+
+    def test_ensure_schedule_group_retries_conflict(self):
+        """Test a conflict with a pending delete is retried until the group is created"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        with Stubber(scheduler) as stubber, patch('lambda_function.time.sleep') as mock_sleep:
+            stubber.add_client_error('create_schedule_group', 'ConflictException')
+            group_arn = 'arn:aws:scheduler:us-east-1:123456789012:schedule-group/test-group'
+            stubber.add_response('create_schedule_group', {'ScheduleGroupArn': group_arn})
+
+            ensure_schedule_group_exists(scheduler, 'test-group', retry_on_conflict=True)
+            stubber.assert_no_pending_responses()
+
+        mock_sleep.assert_called_once_with(SCHEDULE_GROUP_BACKOFF[0])
+
+    def test_ensure_schedule_group_raises_on_lasting_conflict(self):
+        """Test a conflict that outlasts the backoff is raised rather than ignored"""
+        scheduler = boto3.client('scheduler', region_name='us-east-1')
+        with Stubber(scheduler) as stubber, patch('lambda_function.time.sleep'):
+            for _ in range(len(SCHEDULE_GROUP_BACKOFF) + 1):
+                stubber.add_client_error('create_schedule_group', 'ConflictException')
+
+            with pytest.raises(scheduler.exceptions.ConflictException):
+                ensure_schedule_group_exists(scheduler, 'test-group', retry_on_conflict=True)
+
+
 class TestLambdaHandler:
     """Test the main lambda handler function"""
 
@@ -581,6 +917,79 @@ END:VCALENDAR"""
             assert result['success'] is True
             assert result['calendars_processed'] == 1
             assert result['total_events'] == 1
+            assert result['schedules_created'] == 1
+            assert result['schedules_failed'] == 0
+
+    @mock_aws
+    def test_lambda_handler_skips_duplicate_events_across_files(self):
+        """Test an event repeated in two calendar files gets a single schedule"""
+        with patch.dict(os.environ, HANDLER_ENV):
+            s3 = boto3.client('s3', region_name='us-east-1')
+            s3.create_bucket(Bucket='test-bucket')
+
+            tomorrow = (datetime.now(tz=pytz.UTC) + timedelta(days=1)).replace(microsecond=0)
+            shared_event = make_ical('shared-001@example.com', tomorrow, summary='Shared')
+            event = make_zip_payload({'work.ics': shared_event, 'personal.ics': shared_event})
+
+            result = lambda_handler(event, {})
+
+            scheduler = boto3.client('scheduler', region_name='us-east-1')
+            schedules = scheduler.list_schedules(GroupName='test-group')['Schedules']
+
+            assert result['success'] is True
+            assert result['calendars_processed'] == 2
+            assert result['total_events'] == 1
+            assert len(schedules) == 1
+
+    @mock_aws
+    def test_lambda_handler_reports_failed_schedules(self):
+        """Test lambda handler fails when schedules can't be created"""
+        with patch.dict(os.environ, HANDLER_ENV):
+            s3 = boto3.client('s3', region_name='us-east-1')
+            s3.create_bucket(Bucket='test-bucket')
+
+            tomorrow = datetime.now(tz=pytz.UTC) + timedelta(days=1)
+            event = make_zip_payload({'test.ics': make_ical('test-001@example.com', tomorrow)})
+
+            access_denied = ClientError(
+                {'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}},
+                'CreateSchedule',
+            )
+            scheduler = lambda_function._scheduler()
+            with patch.object(scheduler, 'create_schedule', side_effect=access_denied):
+                result = lambda_handler(event, {})
+
+            assert result['success'] is False
+            assert result['total_events'] == 1
+            assert result['schedules_created'] == 0
+            assert result['schedules_failed'] == 1
+            assert 'Failed to create 1 of 1 schedules' in result['error']
+
+    @mock_aws
+    def test_lambda_handler_zip_without_calendars(self):
+        """Test lambda handler rejects a zip with no .ics files before clearing anything"""
+        with patch.dict(os.environ, {
+            'S3_BUCKET_NAME': 'test-bucket',
+            'SCHEDULE_GROUP_NAME': 'test-group',
+            'NOTIFICATION_LAMBDA_ARN': 'arn:aws:lambda:us-east-1:123456789012:function:notify',
+            'SCHEDULER_ROLE_ARN': 'arn:aws:iam::123456789012:role/scheduler'
+        }):
+            s3 = boto3.client('s3', region_name='us-east-1')
+            s3.create_bucket(Bucket='test-bucket')
+            s3.put_object(Bucket='test-bucket', Key='existing.ics', Body=b'test')
+
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, 'w') as zf:
+                zf.writestr('readme.txt', 'not a calendar file')
+
+            zip_b64 = base64.b64encode(zip_buffer.getvalue()).decode('utf-8')
+
+            result = lambda_handler({'zip_file': zip_b64}, {})
+
+            assert result['success'] is False
+            assert 'No .ics files' in result['error']
+            # Existing calendars are left in place
+            assert s3.get_object(Bucket='test-bucket', Key='existing.ics')['Body'].read() == b'test'
 
     def test_lambda_handler_missing_env_vars(self):
         """Test lambda handler with missing environment variables"""
@@ -593,6 +1002,33 @@ END:VCALENDAR"""
             assert result['success'] is False
             assert 'S3_BUCKET_NAME' in result['error']
 
+    def test_lambda_handler_missing_schedule_configuration(self):
+        """Test lambda handler fails fast when the schedule target ARNs are missing"""
+        with patch.dict(os.environ, {
+            'S3_BUCKET_NAME': 'test-bucket',
+            'SCHEDULE_GROUP_NAME': 'test-group'
+        }, clear=True), patch('lambda_function.decode_zip_file') as mock_decode:
+            result = lambda_handler({'zip_file': 'test'}, {})
+
+            assert result['success'] is False
+            assert 'NOTIFICATION_LAMBDA_ARN' in result['error']
+            mock_decode.assert_not_called()
+
+    def test_lambda_handler_invalid_fallback_timezone(self):
+        """Test lambda handler fails fast on a FALLBACK_TIMEZONE that doesn't exist"""
+        with patch.dict(os.environ, {
+            'S3_BUCKET_NAME': 'test-bucket',
+            'SCHEDULE_GROUP_NAME': 'test-group',
+            'NOTIFICATION_LAMBDA_ARN': 'arn:aws:lambda:us-east-1:123456789012:function:notify',
+            'SCHEDULER_ROLE_ARN': 'arn:aws:iam::123456789012:role/scheduler',
+            'FALLBACK_TIMEZONE': 'Mars/Olympus_Mons'
+        }, clear=True), patch('lambda_function.decode_zip_file') as mock_decode:
+            result = lambda_handler({'zip_file': 'test'}, {})
+
+            assert result['success'] is False
+            assert 'FALLBACK_TIMEZONE' in result['error']
+            mock_decode.assert_not_called()
+
     def test_lambda_handler_missing_zip_file(self):
         """Test lambda handler with missing zip file"""
         with patch.dict(os.environ, {
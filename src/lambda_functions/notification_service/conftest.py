@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+# boto3, botocore and moto are imported inside the fixtures rather than at module
+# level, so collecting the tests (e.g. with -k) doesn't pay for loading them
+
+# Fake credentials and a region, so botocore's credential chain and region lookup
+# resolve from the environment instead of probing config files or instance metadata
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_SECURITY_TOKEN", "testing")
+os.environ.setdefault("AWS_SESSION_TOKEN", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture(scope="session")
+def aws_mock():
+    """Single moto mock, started by the first test that talks to SNS and kept for the session"""
+    from moto import mock_aws
+
+    with mock_aws():
+        yield
+
+
+@pytest.fixture(scope="session")
+def sns_client(aws_mock):
+    """SNS client built once - each new client re-parses botocore's service model"""
+    import boto3
+
+    return boto3.client("sns", region_name="us-east-1")
+
+
+@pytest.fixture(scope="session")
+def sns_topic_arn(sns_client):
+    """The calendar-notifications topic, created once per session (CreateTopic is idempotent)"""
+    return sns_client.create_topic(Name="calendar-notifications")["TopicArn"]
+
+
+@pytest.fixture
+def stubbed_sns():
+    """SNS client answered by botocore's Stubber - canned responses, no moto backend"""
+    import boto3
+    from botocore.stub import Stubber
+
+    sns = boto3.client("sns", region_name="us-east-1")
+    with Stubber(sns) as stubber:
+        yield sns, stubber
+        stubber.assert_no_pending_responses()
@@ -1,7 +1,39 @@
 import boto3
 import json
 import os
-from typing import Dict
+import re
+from typing import Dict, List
+
+# ASCII control characters left after whitespace collapsing; anything above 127
+# (accents, emojis) is kept
+_CTRL_DELETE = dict.fromkeys([*range(32), 127])
+
+# Runs of whitespace (newlines, tabs, repeated spaces) collapse to one space
+_WS_RE = re.compile(r"\s+")
+
+# Encoder for logging incoming events, built once rather than per invocation
+_EVENT_LOG_ENCODER = json.JSONEncoder(default=str)
+
+# Fields every notification payload must carry
+_REQUIRED_FIELDS = frozenset({"event_summary", "event_time", "notification_type"})
+
+# Single SMS segment length; longer titles are truncated to fit
+_SMS_LIMIT = 160
+
+# PublishBatch accepts at most 10 entries per request
+SNS_BATCH_SIZE = 10
+
+# Created on the first notification and reused by warm invocations
+_SNS = None
+
+
+def _sns():
+    """
+    Shared SNS client
+    """
+    global _SNS
+    _SNS = _SNS or boto3.client("sns")
+    return _SNS
 
 
 def validate_environment_variables():
@@ -30,15 +62,10 @@ def validate_event_payload(event):
     """
     Validate EventBridge event payload contains required notification fields
     """
-    required_fields = ["event_summary", "event_time", "notification_type"]
-    missing_fields = []
-
-    for field in required_fields:
-        if field not in event:
-            missing_fields.append(field)
+    missing_fields = _REQUIRED_FIELDS - event.keys()
 
     if missing_fields:
-        return None, [f"Missing required fields: {', '.join(missing_fields)}"]
+        return None, [f"Missing required fields: {', '.join(sorted(missing_fields))}"]
 
     return event, []
 
@@ -51,10 +78,10 @@ def sanitize_event_summary(summary: str) -> str:
         return "Untitled Event"
 
     # Remove newlines, tabs, and excessive whitespace
-    cleaned = " ".join(summary.strip().split())
+    cleaned = _WS_RE.sub(" ", summary).strip()
 
     # Remove non-printable characters but keep emojis
-    cleaned = "".join(char for char in cleaned if char.isprintable() or ord(char) > 127)
+    cleaned = cleaned.translate(_CTRL_DELETE)
 
     return cleaned
 
@@ -67,15 +94,12 @@ def format_notification_message(event_data: Dict, notification_minutes: int) ->
     event_summary = sanitize_event_summary(raw_summary)
     suffix = f" ({notification_minutes}min)"
 
-    # Check if we need to truncate
-    if len(event_summary) + len(suffix) > 160:
-        max_title_length = 160 - len(suffix) - 3  # Reserve space for "..."
-        truncated_title = event_summary[:max_title_length] + "..."
-        message = f"{truncated_title}{suffix}"
-    else:
-        message = f"{event_summary}{suffix}"
+    # Truncate the title if title + suffix won't fit in one SMS
+    max_title_length = _SMS_LIMIT - len(suffix)
+    if len(event_summary) > max_title_length:
+        event_summary = event_summary[:max_title_length - 3] + "..."  # Reserve space for "..."
 
-    return message
+    return event_summary + suffix
 
 
 def send_sms_notification(
@@ -99,11 +123,93 @@ def send_sms_notification(
         return {"status": "failed", "error": str(e)}
 
 
+def send_sms_batch(
+    sns_client, topic_arn: str, messages: List[str], subject: str = "Calendar Reminder"
+) -> Dict:
+    """
+    Send several SMS notifications via SNS PublishBatch, 10 per request
+    """
+    message_ids = []
+    errors = []
+
+    for start in range(0, len(messages), SNS_BATCH_SIZE):
+        entries = [
+            {"Id": str(index), "Message": message, "Subject": subject}
+            for index, message in enumerate(messages[start:start + SNS_BATCH_SIZE], start)
+        ]
+        try:
+            response = sns_client.publish_batch(
+                TopicArn=topic_arn, PublishBatchRequestEntries=entries
+            )
+        except Exception as e:
+            errors.extend(f"{entry['Id']}: {e}" for entry in entries)
+            continue
+
+        message_ids.extend(item["MessageId"] for item in response.get("Successful", []))
+        errors.extend(
+            f"{item['Id']}: {item.get('Message', item['Code'])}"
+            for item in response.get("Failed", [])
+        )
+
+    if errors:
+        return {"status": "failed", "message_ids": message_ids, "error": "; ".join(errors)}
+
+    return {"status": "success", "message_ids": message_ids}
+
+
+def get_record_payload(record):
+    """
+    Return the notification payload carried by a batched record - either the
+    record itself or its JSON "body" (SQS / EventBridge Pipes). Raises
+    ValueError unless both turn out to be JSON objects.
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+
+    body = record.get("body", record)
+    payload = json.loads(body) if isinstance(body, str) else body
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+    return payload
+
+
+def process_notification_batch(events, sns_topic_arn, notification_minutes):
+    """
+    Process several notifications at once, sending them with PublishBatch
+    """
+    messages = [format_notification_message(event, notification_minutes) for event in events]
+
+    print(f"Formatted {len(messages)} messages")
+
+    result = send_sms_batch(_sns(), sns_topic_arn, messages, "Calendar Reminder")
+
+    if result["status"] == "success":
+        print(f"{len(result['message_ids'])} SMS sent successfully")
+        return {
+            "message": "Notifications sent successfully",
+            "notifications_sent": len(result["message_ids"]),
+            "message_ids": result["message_ids"],
+            "success": True,
+        }
+    else:
+        print(f"Failed to send SMS: {result['error']}")
+        return {
+            "error": f"SMS sending failed: {result['error']}",
+            "notifications_sent": len(result["message_ids"]),
+            "success": False,
+        }
+
+
 def process_notification(event, sns_topic_arn, notification_minutes):
     """
     Process the notification by formatting message and sending SMS
     """
-    sns = boto3.client("sns")
+    if "Records" in event:
+        return process_notification_batch(
+            event["Records"], sns_topic_arn, notification_minutes
+        )
+
+    sns = _sns()
     message = format_notification_message(event, notification_minutes)
 
     print(f"Formatted message ({len(message)} chars): {message}")
@@ -128,17 +234,30 @@ def lambda_handler(event, context):
     """
     Handle EventBridge schedule notifications by sending SMS via SNS
     """
-    print(f"Received event: {json.dumps(event, default=str)}")
+    print(f"Received event: {_EVENT_LOG_ENCODER.encode(event)}")
 
     # Validate environment variables
     sns_topic_arn, notification_minutes, env_errors = validate_environment_variables()
     if env_errors:
         return {"error": env_errors[0], "success": False}
 
-    # Validate event payload
-    validated_event, payload_errors = validate_event_payload(event)
-    if payload_errors:
-        return {"error": payload_errors[0], "success": False}
+    # Validate event payload - batched deliveries carry one notification per record
+    if "Records" in event:
+        if not isinstance(event["Records"], list):
+            return {"error": "Records must be a list", "success": False}
+        try:
+            records = [get_record_payload(record) for record in event["Records"]]
+        except ValueError as e:
+            return {"error": f"Invalid record body: {e}", "success": False}
+        for record in records:
+            _, payload_errors = validate_event_payload(record)
+            if payload_errors:
+                return {"error": payload_errors[0], "success": False}
+        validated_event = {"Records": records}
+    else:
+        validated_event, payload_errors = validate_event_payload(event)
+        if payload_errors:
+            return {"error": payload_errors[0], "success": False}
 
     try:
         return process_notification(
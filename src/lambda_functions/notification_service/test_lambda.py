@@ -1,105 +1,107 @@
 import pytest
 import json
-import os
-import boto3
-from unittest.mock import patch, MagicMock
-from moto import mock_aws
-from lambda_function import (
-    validate_environment_variables,
-    validate_event_payload,
-    format_notification_message,
-    sanitize_event_summary,
-    send_sms_notification,
-    process_notification,
-    lambda_handler,
-)
+from unittest.mock import ANY, patch
+
+TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:calendar-notifications"
+PUBLISH_RESPONSE = {"MessageId": "abc123", "ResponseMetadata": {"HTTPStatusCode": 200}}
+
+# A title that fills a 160-character SMS exactly once the suffix is added
+SUFFIX_15 = " (15min)"
+EXACT_TITLE = "A" * (160 - len(SUFFIX_15))
+EXACT_EXPECTED = EXACT_TITLE + SUFFIX_15
+
+
+@pytest.fixture(scope="module")
+def lf():
+    """The module under test, imported when the first test that needs it runs"""
+    import lambda_function
+
+    return lambda_function
+
+
+@pytest.fixture
+def clear_env(monkeypatch):
+    """monkeypatch with the notification service's variables unset - set what the test needs"""
+    monkeypatch.delenv("SNS_TOPIC_ARN", raising=False)
+    monkeypatch.delenv("NOTIFICATION_MINUTES_BEFORE", raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def sns_publish(request, stubbed_sns):
+    """Stubbed SNS client with one publish outcome queued for a "valid" or "invalid" topic"""
+    sns, stubber = stubbed_sns
+    if request.param == "valid":
+        stubber.add_response(
+            "publish",
+            PUBLISH_RESPONSE,
+            expected_params={"TopicArn": TOPIC_ARN, "Message": ANY, "Subject": ANY},
+        )
+        return sns, TOPIC_ARN
+
+    stubber.add_client_error("publish", service_error_code="NotFound", http_status_code=404)
+    return sns, "arn:aws:sns:us-east-1:123456789012:nonexistent-topic"
 
 
 class TestValidation:
     """Test validation functions"""
 
-    def test_validate_environment_variables_success(self):
-        """Test successful environment variable validation"""
-        with patch.dict(
-            os.environ,
-            {
-                "SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:123456789012:calendar-notifications",
-                "NOTIFICATION_MINUTES_BEFORE": "30",
-            },
-        ):
-            topic_arn, minutes, errors = validate_environment_variables()
-            assert (
-                topic_arn == "arn:aws:sns:us-east-1:123456789012:calendar-notifications"
-            )
-            assert minutes == 30
-            assert errors == []
-
-    def test_validate_environment_variables_default_minutes(self):
-        """Test default notification minutes when not specified"""
-        with patch.dict(
-            os.environ,
-            {
-                "SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:123456789012:calendar-notifications"
-            },
-            clear=True,
-        ):
-            topic_arn, minutes, errors = validate_environment_variables()
-            assert minutes == 15  # default value
-
-    def test_validate_environment_variables_missing_sns(self):
-        """Test missing SNS topic ARN"""
-        with patch.dict(os.environ, {}, clear=True):
-            topic_arn, minutes, errors = validate_environment_variables()
-            assert topic_arn is None
-            assert len(errors) == 1
-            assert "SNS_TOPIC_ARN" in errors[0]
-
-    def test_validate_environment_variables_invalid_minutes(self):
-        """Test invalid notification minutes"""
-        with patch.dict(os.environ, {
-            'SNS_TOPIC_ARN': 'arn:aws:sns:us-east-1:123456789012:calendar-notifications',
-            'NOTIFICATION_MINUTES_BEFORE': 'invalid'
-        }):
-            topic_arn, minutes, errors = validate_environment_variables()
-            assert len(errors) == 1
-            assert 'valid integer' in errors[0]
-            assert minutes == 15  # fallback value
-
-    def test_validate_environment_variables_out_of_range_minutes(self):
-        """Test out of range notification minutes"""
-        with patch.dict(os.environ, {
-            'SNS_TOPIC_ARN': 'arn:aws:sns:us-east-1:123456789012:calendar-notifications',
-            'NOTIFICATION_MINUTES_BEFORE': '2000'  # Over 24 hours
-        }):
-            topic_arn, minutes, errors = validate_environment_variables()
+    @pytest.mark.parametrize(
+        "env, expected_arn, expected_minutes, expected_error",
+        [
+            pytest.param(
+                {"SNS_TOPIC_ARN": TOPIC_ARN, "NOTIFICATION_MINUTES_BEFORE": "30"},
+                TOPIC_ARN, 30, None, id="success",
+            ),
+            pytest.param({"SNS_TOPIC_ARN": TOPIC_ARN}, TOPIC_ARN, 15, None, id="default_minutes"),
+            pytest.param({}, None, 15, "SNS_TOPIC_ARN", id="missing_sns"),
+            pytest.param(
+                {"SNS_TOPIC_ARN": TOPIC_ARN, "NOTIFICATION_MINUTES_BEFORE": "invalid"},
+                TOPIC_ARN, 15, "valid integer", id="invalid_minutes",  # fallback value
+            ),
+            pytest.param(
+                # Over 24 hours
+                {"SNS_TOPIC_ARN": TOPIC_ARN, "NOTIFICATION_MINUTES_BEFORE": "2000"},
+                TOPIC_ARN, 2000, "between 1 and 1440", id="out_of_range_minutes",
+            ),
+            pytest.param(
+                {"SNS_TOPIC_ARN": TOPIC_ARN, "NOTIFICATION_MINUTES_BEFORE": "-5"},
+                TOPIC_ARN, -5, "between 1 and 1440", id="negative_minutes",
+            ),
+        ],
+    )
+    def test_validate_environment_variables(
+        self, lf, clear_env, env, expected_arn, expected_minutes, expected_error
+    ):
+        """Test environment variable validation"""
+        for name, value in env.items():
+            clear_env.setenv(name, value)
+
+        topic_arn, minutes, errors = lf.validate_environment_variables()
+
+        assert topic_arn == expected_arn
+        assert minutes == expected_minutes
+        if expected_error:
             assert len(errors) == 1
-            assert 'between 1 and 1440' in errors[0]
-
-    def test_validate_environment_variables_negative_minutes(self):
-        """Test negative notification minutes"""
-        with patch.dict(os.environ, {
-            'SNS_TOPIC_ARN': 'arn:aws:sns:us-east-1:123456789012:calendar-notifications',
-            'NOTIFICATION_MINUTES_BEFORE': '-5'
-        }):
-            topic_arn, minutes, errors = validate_environment_variables()
-            assert len(errors) == 1
-            assert 'between 1 and 1440' in errors[0]
+            assert expected_error in errors[0]
+        else:
+            assert errors == []
 
-    def test_validate_event_payload_success(self):
+    def test_validate_event_payload_success(self, lf):
         """Test successful event payload validation"""
         event = {
             "event_summary": "Team Meeting",
             "event_time": "2024-12-25T10:00:00",
             "notification_type": "calendar_reminder",
         }
-        validated_event, errors = validate_event_payload(event)
+        validated_event, errors = lf.validate_event_payload(event)
         assert validated_event == event
         assert errors == []
 
-    def test_validate_event_payload_missing_fields(self):
+    def test_validate_event_payload_missing_fields(self, lf):
         """Test missing required fields in event payload"""
         event = {"event_summary": "Meeting"}
-        validated_event, errors = validate_event_payload(event)
+        validated_event, errors = lf.validate_event_payload(event)
         assert validated_event is None
         assert len(errors) == 1
         assert "event_time" in errors[0]
@@ -109,253 +111,254 @@ class TestValidation:
 class TestInputSanitization:
     """Test input sanitization functionality"""
 
-    def test_sanitize_event_summary_normal_text(self):
-        """Test sanitizing normal event summary"""
-        result = sanitize_event_summary("Team Meeting")
-        assert result == "Team Meeting"
-
-    def test_sanitize_event_summary_empty_string(self):
-        """Test sanitizing empty event summary"""
-        result = sanitize_event_summary("")
-        assert result == "Untitled Event"
-
-    def test_sanitize_event_summary_whitespace_only(self):
-        """Test sanitizing whitespace-only event summary"""
-        result = sanitize_event_summary("   \t\n   ")
-        assert result == "Untitled Event"
-
-    def test_sanitize_event_summary_with_newlines(self):
-        """Test sanitizing event summary with newlines"""
-        result = sanitize_event_summary("Line 1\nLine 2\nLine 3")
-        assert result == "Line 1 Line 2 Line 3"
-
-    def test_sanitize_event_summary_with_excessive_whitespace(self):
-        """Test sanitizing event summary with excessive whitespace"""
-        result = sanitize_event_summary("  Multiple   spaces    everywhere  ")
-        assert result == "Multiple spaces everywhere"
-
-    def test_sanitize_event_summary_with_tabs(self):
-        """Test sanitizing event summary with tabs"""
-        result = sanitize_event_summary("Tab\tSeparated\tValues")
-        assert result == "Tab Separated Values"
-
-    def test_sanitize_event_summary_with_emojis(self):
-        """Test sanitizing event summary preserves emojis"""
-        result = sanitize_event_summary("Meeting 📅 at office 🏢")
-        assert result == "Meeting 📅 at office 🏢"
-
-    def test_sanitize_event_summary_none_input(self):
-        """Test sanitizing None input"""
-        result = sanitize_event_summary(None)
-        assert result == "Untitled Event"
+    @pytest.mark.parametrize(
+        "summary, expected",
+        [
+            pytest.param("Team Meeting", "Team Meeting", id="normal_text"),
+            pytest.param("", "Untitled Event", id="empty_string"),
+            pytest.param("   \t\n   ", "Untitled Event", id="whitespace_only"),
+            pytest.param("Line 1\nLine 2\nLine 3", "Line 1 Line 2 Line 3", id="newlines"),
+            pytest.param(
+                "  Multiple   spaces    everywhere  ", "Multiple spaces everywhere",
+                id="excessive_whitespace",
+            ),
+            pytest.param("Tab\tSeparated\tValues", "Tab Separated Values", id="tabs"),
+            pytest.param("Meeting 📅 at office 🏢", "Meeting 📅 at office 🏢", id="emojis"),
+            pytest.param(
+                "Caf\u00e9\x00 Meet\x07ing\x7f", "Caf\u00e9 Meeting", id="control_characters"
+            ),
+            pytest.param(None, "Untitled Event", id="none_input"),
+        ],
+    )
+    def test_sanitize_event_summary(self, lf, summary, expected):
+        """Test event summary sanitization"""
+        assert lf.sanitize_event_summary(summary) == expected
 
 
 class TestMessageFormatting:
     """Test message formatting functions"""
 
-    def test_format_notification_message_simple(self):
-        """Test simple message formatting"""
-        event_data = {
-            "event_summary": "Team Meeting",
-            "event_time": "2024-12-25T10:00:00",
-        }
-        message = format_notification_message(event_data, 15)
-        assert message == "Team Meeting (15min)"
+    @pytest.mark.parametrize(
+        "event_data, minutes, expected",
+        [
+            pytest.param(
+                {"event_summary": "Team Meeting"}, 15, "Team Meeting (15min)", id="simple"
+            ),
+            pytest.param(
+                {"event_summary": "Doctor Appointment"}, 30, "Doctor Appointment (30min)",
+                id="different_minutes",
+            ),
+            pytest.param(
+                {"event_summary": EXACT_TITLE}, 15, EXACT_EXPECTED, id="exactly_160_chars"
+            ),
+            pytest.param(
+                {"event_summary": "  Meeting\nwith\ttabs  and\n\nnewlines  "}, 15,
+                "Meeting with tabs and newlines (15min)", id="dirty_input",
+            ),
+            pytest.param({"event_summary": ""}, 15, "Untitled Event (15min)", id="empty_summary"),
+            pytest.param({}, 30, "Untitled Event (30min)", id="missing_summary"),
+        ],
+    )
+    def test_format_notification_message(self, lf, event_data, minutes, expected):
+        """Test message formatting"""
+        event_data = {**event_data, "event_time": "2024-12-25T10:00:00"}
+        message = lf.format_notification_message(event_data, minutes)
 
-    def test_format_notification_message_different_minutes(self):
-        """Test message formatting with different notification minutes"""
-        event_data = {
-            "event_summary": "Doctor Appointment",
-            "event_time": "2024-12-25T10:00:00",
-        }
-        message = format_notification_message(event_data, 30)
-        assert message == "Doctor Appointment (30min)"
+        assert len(message) <= 160
+        assert message == expected
 
-    def test_format_notification_message_long_title(self):
+    def test_format_notification_message_long_title(self, lf):
         """Test message formatting with long title that needs truncation"""
         long_title = "This is a very long meeting title that definitely exceeds the SMS character limit and needs to be truncated properly for sure this time with extra words and more text"
         event_data = {"event_summary": long_title, "event_time": "2024-12-25T10:00:00"}
-        message = format_notification_message(event_data, 15)
+        message = lf.format_notification_message(event_data, 15)
 
         assert len(message) <= 160
         assert message.endswith("... (15min)")
         assert "This is a very long meeting" in message
 
-    def test_format_notification_message_exactly_160_chars(self):
-        """Test message that's exactly at the 160 character limit"""
-        # Create a title that results in exactly 160 characters
-        title_length = 160 - len(" (15min)")
-        exact_title = "A" * title_length
-        event_data = {"event_summary": exact_title, "event_time": "2024-12-25T10:00:00"}
-        message = format_notification_message(event_data, 15)
-
-        assert len(message) == 160
-        assert message == f"{exact_title} (15min)"
-
-    def test_format_notification_message_with_dirty_input(self):
-        """Test message formatting with input that needs sanitization"""
-        event_data = {
-            "event_summary": "  Meeting\nwith\ttabs  and\n\nnewlines  ",
-            "event_time": "2024-12-25T10:00:00"
-        }
-        message = format_notification_message(event_data, 15)
-
-        assert message == "Meeting with tabs and newlines (15min)"
-
-    def test_format_notification_message_empty_summary(self):
-        """Test message formatting with empty summary"""
-        event_data = {
-            "event_summary": "",
-            "event_time": "2024-12-25T10:00:00"
-        }
-        message = format_notification_message(event_data, 15)
-
-        assert message == "Untitled Event (15min)"
-
-    def test_format_notification_message_missing_summary(self):
-        """Test message formatting with missing summary field"""
-        event_data = {
-            "event_time": "2024-12-25T10:00:00"
-        }
-        message = format_notification_message(event_data, 30)
-
-        assert message == "Untitled Event (30min)"
-
 
 class TestSNSOperations:
     """Test SNS-related functions"""
 
-    @mock_aws
-    def test_send_sms_notification_success(self):
-        """Test successful SMS sending"""
-        # Create mock SNS topic
-        sns = boto3.client("sns", region_name="us-east-1")
-        response = sns.create_topic(Name="calendar-notifications")
-        topic_arn = response["TopicArn"]
-
-        result = send_sms_notification(sns, topic_arn, "Test message", "Test Subject")
+    @pytest.mark.parametrize(
+        "sns_publish, expected_status",
+        [("valid", "success"), ("invalid", "failed")],
+        indirect=["sns_publish"],
+        ids=["success", "invalid_topic"],
+    )
+    def test_send_sms_notification(self, lf, sns_publish, expected_status):
+        """Test SMS sending to a valid and an invalid topic ARN"""
+        sns, topic_arn = sns_publish
+
+        result = lf.send_sms_notification(sns, topic_arn, "Test message", "Test Subject")
+
+        assert result["status"] == expected_status
+        if expected_status == "success":
+            assert result["message_id"] == "abc123"
+            assert result["sns_response"]["ResponseMetadata"]["HTTPStatusCode"] == 200
+        else:
+            assert "error" in result
+
+    def test_send_sms_batch_success(self, lf, sns_client, sns_topic_arn):
+        """Test batched SMS sending splits into PublishBatch calls of 10"""
+        messages = [f"Meeting {i} (15min)" for i in range(12)]
+
+        with patch.object(
+            sns_client, "publish_batch", wraps=sns_client.publish_batch
+        ) as mock_batch:
+            result = lf.send_sms_batch(sns_client, sns_topic_arn, messages)
 
         assert result["status"] == "success"
-        assert "message_id" in result
-        assert result["sns_response"]["ResponseMetadata"]["HTTPStatusCode"] == 200
-
-    @mock_aws
-    def test_send_sms_notification_invalid_topic(self):
-        """Test SMS sending with invalid topic ARN"""
-        sns = boto3.client("sns", region_name="us-east-1")
-        invalid_arn = "arn:aws:sns:us-east-1:123456789012:nonexistent-topic"
+        assert len(result["message_ids"]) == 12
+        assert mock_batch.call_count == 2
+
+    def test_send_sms_batch_partial_failure(self, lf, stubbed_sns):
+        """Test that Failed entries in a PublishBatch response are reported"""
+        sns, stubber = stubbed_sns
+        stubber.add_response(
+            "publish_batch",
+            {
+                "Successful": [{"Id": "0", "MessageId": "abc123"}],
+                "Failed": [
+                    {"Id": "1", "Code": "InternalError", "SenderFault": False, "Message": "boom"}
+                ],
+            },
+        )
 
-        result = send_sms_notification(sns, invalid_arn, "Test message", "Test Subject")
+        result = lf.send_sms_batch(sns, TOPIC_ARN, ["Meeting 0 (15min)", "Meeting 1 (15min)"])
 
         assert result["status"] == "failed"
-        assert "error" in result
+        assert result["message_ids"] == ["abc123"]
+        assert result["error"] == "1: boom"
 
 
 class TestNotificationProcessing:
     """Test notification processing logic"""
 
-    @mock_aws
-    def test_process_notification_success(self):
+    def test_process_notification_success(self, lf):
         """Test successful notification processing"""
-        # Setup SNS
-        sns = boto3.client("sns", region_name="us-east-1")
-        response = sns.create_topic(Name="calendar-notifications")
-        topic_arn = response["TopicArn"]
-
         event = {
             "event_summary": "Team Meeting",
             "event_time": "2024-12-25T10:00:00",
             "notification_type": "calendar_reminder",
         }
 
-        result = process_notification(event, topic_arn, 15)
+        with patch("lambda_function._sns") as mock_sns:
+            mock_sns.return_value.publish.return_value = PUBLISH_RESPONSE
+            result = lf.process_notification(event, TOPIC_ARN, 15)
 
+        mock_sns.return_value.publish.assert_called_once_with(
+            TopicArn=TOPIC_ARN, Message="Team Meeting (15min)", Subject="Calendar Reminder"
+        )
         assert result["success"] is True
         assert result["event_summary"] == "Team Meeting"
-        assert "message_id" in result
+        assert result["message_id"] == "abc123"
         assert result["message_length"] == len("Team Meeting (15min)")
 
 
 class TestLambdaHandler:
     """Test the main lambda handler function"""
 
-    @mock_aws
-    def test_lambda_handler_success(self):
+    def test_lambda_handler_success(self, lf, clear_env):
         """Test successful lambda handler execution"""
-        # Setup environment and SNS
-        with patch.dict(
-            os.environ,
-            {
-                "SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:123456789012:calendar-notifications",
-                "NOTIFICATION_MINUTES_BEFORE": "15",
-            },
-        ):
-            sns = boto3.client("sns", region_name="us-east-1")
-            sns.create_topic(Name="calendar-notifications")
-
-            event = {
-                "event_summary": "Team Meeting",
-                "event_time": "2024-12-25T10:00:00",
-                "notification_type": "calendar_reminder",
-            }
-            context = {}
+        clear_env.setenv("SNS_TOPIC_ARN", TOPIC_ARN)
+        clear_env.setenv("NOTIFICATION_MINUTES_BEFORE", "15")
+        event = {
+            "event_summary": "Team Meeting",
+            "event_time": "2024-12-25T10:00:00",
+            "notification_type": "calendar_reminder",
+        }
+        context = {}
 
-            result = lambda_handler(event, context)
+        with patch("lambda_function._sns") as mock_sns:
+            mock_sns.return_value.publish.return_value = PUBLISH_RESPONSE
+            result = lf.lambda_handler(event, context)
 
-            assert result["success"] is True
-            assert result["event_summary"] == "Team Meeting"
-            assert "message_id" in result
+        assert result["success"] is True
+        assert result["event_summary"] == "Team Meeting"
+        assert "message_id" in result
 
-    def test_lambda_handler_missing_env_vars(self):
+    def test_lambda_handler_missing_env_vars(self, lf, clear_env):
         """Test lambda handler with missing environment variables"""
-        with patch.dict(os.environ, {}, clear=True):
-            event = {
-                "event_summary": "Meeting",
-                "event_time": "2024-12-25T10:00:00",
-                "notification_type": "calendar_reminder",
-            }
-            context = {}
+        event = {
+            "event_summary": "Meeting",
+            "event_time": "2024-12-25T10:00:00",
+            "notification_type": "calendar_reminder",
+        }
+        context = {}
 
-            result = lambda_handler(event, context)
+        result = lf.lambda_handler(event, context)
 
-            assert result["success"] is False
-            assert "SNS_TOPIC_ARN" in result["error"]
+        assert result["success"] is False
+        assert "SNS_TOPIC_ARN" in result["error"]
 
-    def test_lambda_handler_missing_event_fields(self):
+    def test_lambda_handler_missing_event_fields(self, lf, clear_env):
         """Test lambda handler with missing event fields"""
-        with patch.dict(
-            os.environ,
-            {
-                "SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:123456789012:calendar-notifications"
-            },
-        ):
-            event = {"event_summary": "Meeting"}  # Missing required fields
-            context = {}
+        clear_env.setenv("SNS_TOPIC_ARN", TOPIC_ARN)
+        event = {"event_summary": "Meeting"}  # Missing required fields
+        context = {}
 
-            result = lambda_handler(event, context)
+        result = lf.lambda_handler(event, context)
 
-            assert result["success"] is False
-            assert "Missing required fields" in result["error"]
+        assert result["success"] is False
+        assert "Missing required fields" in result["error"]
 
-    @mock_aws
-    def test_lambda_handler_sns_error(self):
+    def test_lambda_handler_sns_error(self, lf, clear_env, aws_mock):
         """Test lambda handler with SNS error"""
-        with patch.dict(
-            os.environ,
-            {
-                "SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:123456789012:nonexistent-topic",
-                "NOTIFICATION_MINUTES_BEFORE": "15",
-            },
-        ):
-            event = {
-                "event_summary": "Team Meeting",
-                "event_time": "2024-12-25T10:00:00",
-                "notification_type": "calendar_reminder",
-            }
-            context = {}
+        clear_env.setenv("SNS_TOPIC_ARN", "arn:aws:sns:us-east-1:123456789012:nonexistent-topic")
+        clear_env.setenv("NOTIFICATION_MINUTES_BEFORE", "15")
+        event = {
+            "event_summary": "Team Meeting",
+            "event_time": "2024-12-25T10:00:00",
+            "notification_type": "calendar_reminder",
+        }
+        context = {}
+
+        result = lf.lambda_handler(event, context)
 
-            result = lambda_handler(event, context)
+        assert result["success"] is False
+        assert "SMS sending failed" in result["error"]
 
-            assert result["success"] is False
-            assert "SMS sending failed" in result["error"]
+    def test_lambda_handler_batched_records(self, lf, clear_env, sns_topic_arn):
+        """Test lambda handler sends every notification in a batched event"""
+        clear_env.setenv("SNS_TOPIC_ARN", sns_topic_arn)
+        clear_env.setenv("NOTIFICATION_MINUTES_BEFORE", "15")
+        event = {
+            "Records": [
+                {
+                    "body": json.dumps(
+                        {
+                            "event_summary": f"Meeting {i}",
+                            "event_time": "2024-12-25T10:00:00",
+                            "notification_type": "calendar_reminder",
+                        }
+                    )
+                }
+                for i in range(3)
+            ]
+        }
+
+        result = lf.lambda_handler(event, {})
 
+        assert result["success"] is True
+        assert result["notifications_sent"] == 3
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            pytest.param(["oops"], id="record_not_object"),
+            pytest.param([{"body": "[1, 2]"}], id="body_list"),
+            pytest.param([{"body": "null"}], id="body_null"),
+            pytest.param([{"body": "not json"}], id="body_not_json"),
+            pytest.param("oops", id="records_not_list"),
+        ],
+    )
+    def test_lambda_handler_malformed_records(self, lf, clear_env, records):
+        """Test lambda handler rejects batched records that aren't notification objects"""
+        clear_env.setenv("SNS_TOPIC_ARN", TOPIC_ARN)
+
+        result = lf.lambda_handler({"Records": records}, {})
+
+        assert result["success"] is False
+        assert "error" in result
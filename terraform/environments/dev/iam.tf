@@ -62,10 +62,19 @@ resource "aws_iam_role_policy" "ical_processor_policy" {
         Effect = "Allow"
         Action = [
           "scheduler:CreateScheduleGroup",
-          "scheduler:DeleteScheduleGroup"
+          "scheduler:DeleteScheduleGroup",
+          "scheduler:GetScheduleGroup"
         ]
         Resource = "arn:aws:scheduler:${var.aws_region}:${data.aws_caller_identity.current.account_id}:schedule-group/${local.schedule_group}"
       },
+      # ListSchedules does not support resource-level permissions
+      {
+        Effect = "Allow"
+        Action = [
+          "scheduler:ListSchedules"
+        ]
+        Resource = "*"
+      },
       # PassRole permission to delegate the EventBridge scheduler role
       # This allows the Lambda to tell EventBridge "use this role when executing schedules"
       { Effect = "Allow"
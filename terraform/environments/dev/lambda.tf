@@ -98,7 +98,7 @@ data "archive_file" "notification_service_zip" {
   type        = "zip"
   source_dir  = "../../../src/lambda_functions/notification_service"
   output_path = ".temp/notification_service.zip"
-  excludes    = ["venv", "__pycache__", "*.pyc", ".pytest_cache", "test_*.py", "requirements.txt"]
+  excludes    = ["venv", "__pycache__", "*.pyc", ".pytest_cache", "test_*.py", "conftest.py", "requirements.txt"]
 }
 
 # The notification service Lambda function